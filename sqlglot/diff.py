@@ -23,6 +23,8 @@ if t.TYPE_CHECKING:
 class Insert:
     """Indicates that a new node has been inserted"""
 
+    __slots__ = ("expression",)
+
     expression: exp.Expression
 
 
@@ -30,6 +32,8 @@ class Insert:
 class Remove:
     """Indicates that an existing node has been removed"""
 
+    __slots__ = ("expression",)
+
     expression: exp.Expression
 
 
@@ -37,6 +41,8 @@ class Remove:
 class Move:
     """Indicates that an existing node's position within the tree has changed"""
 
+    __slots__ = ("source", "target")
+
     source: exp.Expression
     target: exp.Expression
 
@@ -45,6 +51,8 @@ class Move:
 class Update:
     """Indicates that an existing node has been updated"""
 
+    __slots__ = ("source", "target")
+
     source: exp.Expression
     target: exp.Expression
 
@@ -53,6 +61,8 @@ class Update:
 class Keep:
     """Indicates that an existing node hasn't been changed"""
 
+    __slots__ = ("source", "target")
+
     source: exp.Expression
     target: exp.Expression
 
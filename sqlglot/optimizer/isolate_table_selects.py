@@ -5,11 +5,10 @@ import typing as t
 from sqlglot import alias, exp
 from sqlglot.errors import OptimizeError
 from sqlglot.optimizer.scope import traverse_scope
-from sqlglot.schema import ensure_schema
+from sqlglot.schema import Schema, ensure_schema
 
 if t.TYPE_CHECKING:
     from sqlglot._typing import E
-    from sqlglot.schema import Schema
     from sqlglot.dialects.dialect import DialectType
 
 
@@ -18,7 +17,20 @@ def isolate_table_selects(
     schema: t.Optional[t.Dict | Schema] = None,
     dialect: DialectType = None,
 ) -> E:
-    schema = ensure_schema(schema, dialect=dialect)
+    # A scope can only select from more than one source if the tree contains joins or
+    # laterals, so for simple queries the whole scope traversal below is a no-op and
+    # building the scopes can be skipped outright
+    if not any(expression.find_all(exp.Join, exp.Lateral)):
+        return expression
+
+    if not isinstance(schema, Schema):
+        schema = ensure_schema(schema, dialect=dialect)
+
+    # Whether a table resolves to any columns, keyed by its qualified name. The schema
+    # lookup is by far the most expensive check below, so it's both evaluated last and
+    # cached across the traversal for tables that are selected from multiple times
+    table_has_columns: t.Dict[t.Tuple[str, str, str], bool] = {}
+    column_names = schema.column_names
 
     for scope in traverse_scope(expression):
         if len(scope.selected_sources) == 1:
@@ -29,22 +41,33 @@ def isolate_table_selects(
 
             if (
                 not isinstance(source, exp.Table)
-                or not schema.column_names(source)
                 or isinstance(source.parent, exp.Subquery)
                 or isinstance(source.parent.parent, exp.Table)
             ):
                 continue
 
+            table_key = (source.catalog, source.db, source.name)
+            has_columns = table_has_columns.get(table_key)
+            if has_columns is None:
+                has_columns = bool(column_names(source))
+                table_has_columns[table_key] = has_columns
+
+            if not has_columns:
+                continue
+
             if not source.alias:
                 raise OptimizeError("Tables require an alias. Run qualify_tables optimization.")
 
-            source.replace(
-                exp.select("*")
-                .from_(
-                    alias(source, source.alias_or_name, table=True),
-                    copy=False,
-                )
-                .subquery(source.alias, copy=False)
-            )
+            source.replace(_wrap_table_as_subquery(source))
 
     return expression
+
+
+def _wrap_table_as_subquery(source: exp.Table) -> exp.Subquery:
+    # Equivalent to exp.select("*").from_(...).subquery(...), but assembled with direct
+    # constructors: this runs once per source in every multi-source scope, and the
+    # builders would re-parse "*" and re-dispatch on the alias for each of them
+    select = exp.Select(expressions=[exp.Star()])
+    select.set("from", exp.From(this=alias(source, source.alias_or_name, table=True)))
+
+    return exp.Subquery(this=select, alias=exp.TableAlias(this=exp.to_identifier(source.alias)))
@@ -10,8 +10,13 @@ from sqlglot.optimizer.simplify import flatten, rewrite_between, uniq_sort
 
 logger = logging.getLogger("sqlglot")
 
+# Default maximal estimated distance from cnf/dnf at which conversion is attempted
+DEFAULT_MAX_DISTANCE = 128
 
-def normalize(expression: exp.Expression, dnf: bool = False, max_distance: int = 128):
+
+def normalize(
+    expression: exp.Expression, dnf: bool = False, max_distance: int = DEFAULT_MAX_DISTANCE
+):
     """
     Rewrite sqlglot AST into conjunctive normal form or disjunctive normal form.
 
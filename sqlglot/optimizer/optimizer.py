@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import functools
 import inspect
+import itertools
+import threading
 import typing as t
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-from sqlglot import Schema, exp
+from sqlglot import Schema, exp, parse_one
 from sqlglot.dialects.dialect import DialectType
 from sqlglot.optimizer.annotate_types import annotate_types
 from sqlglot.optimizer.canonicalize import canonicalize
@@ -13,17 +19,22 @@ from sqlglot.optimizer.eliminate_subqueries import eliminate_subqueries
 from sqlglot.optimizer.merge_subqueries import merge_subqueries
 from sqlglot.optimizer.normalize import normalize
 from sqlglot.optimizer.optimize_joins import optimize_joins
-from sqlglot.optimizer.pushdown_predicates import pushdown_predicates
+from sqlglot.optimizer.pushdown_predicates import early_pushdown_predicates, pushdown_predicates
 from sqlglot.optimizer.pushdown_projections import pushdown_projections
 from sqlglot.optimizer.qualify import qualify
 from sqlglot.optimizer.qualify_columns import quote_identifiers
-from sqlglot.optimizer.simplify import simplify
+from sqlglot.optimizer.simplify import FINAL, simplify
 from sqlglot.optimizer.unnest_subqueries import unnest_subqueries
 from sqlglot.schema import ensure_schema
 
 RULES = (
     qualify,
     pushdown_projections,
+    # Pushing predicates down before `normalize` shrinks the predicates that
+    # normalization (which can blow up on wide conjunctions/disjunctions) has to
+    # process; the second `pushdown_predicates` pass then picks up whatever the
+    # conversion to conjunctive normal form has made pushable
+    early_pushdown_predicates,
     normalize,
     unnest_subqueries,
     pushdown_predicates,
@@ -39,6 +50,143 @@ RULES = (
 )
 
 
+def _simplify_ctes_in_parallel(
+    expression: exp.Expression, dialect: DialectType = None
+) -> exp.Expression:
+    """
+    Pre-simplify each top-level CTE in a thread pool.
+
+    This runs right after `qualify`, never before: `simplify` protects expressions
+    that a GROUP BY references from being rewritten, and it can only recognize them
+    once qualification has expanded the alias references in the GROUP BY clause. On
+    a qualified tree the pre-pass applies the same rewrites that the pipeline's own
+    `simplify` pass would, so it front-loads that work without changing the result.
+    Nested CTEs are left to their enclosing CTE's worker so that no two threads
+    touch the same subtree.
+    """
+    ctes = [cte for cte in expression.find_all(exp.CTE) if not cte.find_ancestor(exp.CTE)]
+
+    if len(ctes) > 1:
+        with ThreadPoolExecutor() as executor:
+            futures = [(cte, executor.submit(_simplify_cte, cte.this, dialect)) for cte in ctes]
+            for cte, future in futures:
+                cte.set("this", future.result())
+
+    return expression
+
+
+def _simplify_cte(this: exp.Expression, dialect: DialectType) -> exp.Expression:
+    simplified = simplify(this, dialect=dialect)
+
+    # `simplify` marks the nodes involved in its GROUP BY protection as final and
+    # never unmarks them. Later rules can restructure the tree, so the markers must
+    # not leak into the pipeline's own `simplify` pass, which recomputes them
+    for node in simplified.walk():
+        if node._meta:
+            node._meta.pop(FINAL, None)
+
+    return simplified
+
+
+# `inspect.getfullargspec` is expensive, so the signatures of the default rules are
+# introspected once at import time instead of on every `optimize` call
+_RULE_PARAMS = {
+    rule: tuple(inspect.getfullargspec(rule).args) for rule in (*RULES, _simplify_ctes_in_parallel)
+}
+
+# The kwargs that `optimize` can pass down to the rules
+_POSSIBLE_KWARGS = frozenset(
+    ("db", "catalog", "schema", "dialect", "isolate_tables", "quote_identifiers")
+)
+
+# For each default rule, the exact subset of `optimize`'s kwargs that the rule accepts,
+# so that the rule loop doesn't have to filter the full kwargs dict per call
+_RULE_PLANS = {
+    rule: tuple(param for param in params if param in _POSSIBLE_KWARGS)
+    for rule, params in _RULE_PARAMS.items()
+}
+
+
+def _compile_pipeline(rules: t.Sequence[t.Callable]) -> t.Callable:
+    """
+    Generate a straight-line function that applies `rules` in order, passing each rule
+    only the kwargs it accepts. This specializes the rule loop for the default `RULES`
+    once at import time, instead of re-dispatching per rule on every `optimize` call.
+    """
+    namespace = {f"_rule_{i}": rule for i, rule in enumerate(rules)}
+    lines = ["def pipeline(expression, kwargs):"]
+
+    for i, rule in enumerate(rules):
+        args = "".join(f", {param}=kwargs[{param!r}]" for param in _RULE_PLANS[rule])
+        lines.append(f"    expression = _rule_{i}(expression{args})")
+
+    lines.append("    return expression")
+    exec(compile("\n".join(lines), "<sqlglot.optimizer.pipeline>", "exec"), namespace)
+
+    return namespace["pipeline"]
+
+
+_DEFAULT_PIPELINE = _compile_pipeline(RULES)
+
+# The default pipeline with the parallel CTE pre-pass spliced in right after
+# `qualify`, which it needs to have run (see `_simplify_ctes_in_parallel`)
+_PARALLEL_PIPELINE = _compile_pipeline((RULES[0], _simplify_ctes_in_parallel, *RULES[1:]))
+
+# LRU cache of optimized trees for repeated string inputs. Schemas are keyed by
+# their token (see `_SCHEMA_TOKENS` below), so only calls whose schema identity is
+# stable -- a caller-provided `Schema` instance or the shared default -- participate.
+# Each entry also holds a reference to its schema, and hits are verified against the
+# same live instance, so an entry can never resurface a dead schema's result. Cached
+# trees are copied on the way out so callers can never mutate a cache entry, and the
+# lock keeps the LRU bookkeeping safe when `optimize` is called from multiple threads
+_OPTIMIZE_CACHE: OrderedDict[t.Tuple, t.Tuple[Schema, exp.Expression]] = OrderedDict()
+_OPTIMIZE_CACHE_SIZE = 1024
+_OPTIMIZE_CACHE_LOCK = threading.Lock()
+
+# Schema used when `optimize` is called without one. Sharing a single instance gives
+# schema-less calls a stable schema identity, which keeps the result cache and the
+# fixed-point marker below effective for them
+_DEFAULT_SCHEMA = ensure_schema(None)
+
+# The kwargs that a default `optimize(sql)` call would build, precomputed once
+_DEFAULT_KWARGS = {
+    "db": None,
+    "catalog": None,
+    "schema": _DEFAULT_SCHEMA,
+    "dialect": None,
+    "isolate_tables": True,  # needed for other optimizations to perform well
+    "quote_identifiers": False,
+}
+
+# `meta` key marking a tree as the output of a full default-rules pass. The default
+# rules are a fixed point of themselves, so a marked tree can skip re-optimization as
+# long as it's optimized in the same context (schema, dialect, db, catalog) again.
+# The marker also records the tree's hash at the time it was produced -- the same
+# hash `Expression.__eq__` compares -- so any mutation since then invalidates it.
+# Like the result cache, it only applies to stable schema identities
+OPTIMIZED = "optimized"
+
+# Markers can't hold a strong reference to their schema (`meta` is deep-copied with
+# the tree), so stable schemas are identified by a token instead of their address.
+# Tokens are handed out once per live schema and never reused, which means a marker
+# made against a schema that has since been collected can't match a new schema that
+# recycled its address
+_SCHEMA_TOKENS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_SCHEMA_TOKENS_LOCK = threading.Lock()
+_next_schema_token = itertools.count().__next__
+
+
+def _schema_token(schema: Schema) -> int:
+    token = _SCHEMA_TOKENS.get(schema)
+    if token is None:
+        with _SCHEMA_TOKENS_LOCK:
+            token = _SCHEMA_TOKENS.get(schema)
+            if token is None:
+                token = _next_schema_token()
+                _SCHEMA_TOKENS[schema] = token
+    return token
+
+
 def optimize(
     expression: str | exp.Expression,
     schema: t.Optional[dict | Schema] = None,
@@ -46,6 +194,7 @@ def optimize(
     catalog: t.Optional[str | exp.Identifier] = None,
     dialect: DialectType = None,
     rules: t.Sequence[t.Callable] = RULES,
+    parallel_ctes: bool = False,
     **kwargs,
 ) -> exp.Expression:
     """
@@ -66,29 +215,133 @@ def optimize(
         rules: sequence of optimizer rules to use.
             Many of the rules require tables and columns to be qualified.
             Do not remove `qualify` from the sequence of rules unless you know what you're doing!
+        parallel_ctes: pre-simplify independent CTEs concurrently in a thread pool,
+            right after `qualify` runs. This doesn't change the result and only pays
+            off for queries with many large CTEs, so it's off by default.
         **kwargs: If a rule has a keyword argument with a same name in **kwargs, it will be passed in.
 
     Returns:
         The optimized expression.
+
+    Note:
+        Results for string inputs optimized with the default rules are memoized in a
+        small LRU cache, keyed by the SQL, dialect and schema identity. Only calls
+        that pass a `Schema` instance (or no schema at all) are cached: a schema
+        mapping is wrapped in a short-lived `Schema` object whose identity isn't
+        stable. Hits are verified against the live schema instance, and the cache
+        is lock-guarded so that `optimize` can be called from multiple threads. It
+        can be invalidated with `optimize.cache_clear()`, e.g. after mutating a
+        schema that was previously passed in. Optimized trees are also tagged in their
+        `meta`, so re-optimizing `optimize`'s own output in the same context
+        short-circuits to a copy, as long as the tree hasn't been mutated since.
     """
-    schema = ensure_schema(schema, dialect=dialect)
-    possible_kwargs = {
-        "db": db,
-        "catalog": catalog,
-        "schema": schema,
-        "dialect": dialect,
-        "isolate_tables": True,  # needed for other optimizations to perform well
-        "quote_identifiers": False,
-        **kwargs,
-    }
-
-    optimized = exp.maybe_parse(expression, dialect=dialect, copy=True)
-    for rule in rules:
-        # Find any additional rule parameters, beyond `expression`
-        rule_params = inspect.getfullargspec(rule).args
-        rule_kwargs = {
-            param: possible_kwargs[param] for param in rule_params if param in possible_kwargs
+    if schema is None and dialect is None and not kwargs:
+        # Extra kwargs are excluded because rules like `qualify` can be told to add
+        # inferred tables to the schema they're given, and the shared default schema
+        # must never be mutated
+        schema = _DEFAULT_SCHEMA
+        stable_schema = True
+    elif isinstance(schema, Schema):
+        stable_schema = True
+    else:
+        # The wrapper built here is thrown away when this call returns, so its identity
+        # says nothing about the mapping it wraps -- it must not key any caching
+        schema = ensure_schema(schema, dialect=dialect)
+        stable_schema = False
+
+    context = (_schema_token(schema), dialect, db, catalog) if stable_schema else None
+
+    if (
+        stable_schema
+        and rules is RULES
+        and not kwargs
+        and isinstance(expression, exp.Expression)
+        and expression._meta
+    ):
+        marker = expression._meta.get(OPTIMIZED)
+        if marker and marker[0] == context and marker[1] == hash(expression):
+            return expression.copy()
+
+    cache_key = None
+    if stable_schema and isinstance(expression, str) and rules is RULES and not kwargs:
+        cache_key = (expression, *context)
+        with _OPTIMIZE_CACHE_LOCK:
+            entry = _OPTIMIZE_CACHE.get(cache_key)
+            cached = entry[1] if entry is not None and entry[0] is schema else None
+            if cached is not None:
+                _OPTIMIZE_CACHE.move_to_end(cache_key)
+        if cached is not None:
+            return cached.copy()
+
+    if schema is _DEFAULT_SCHEMA and db is None and catalog is None and not kwargs:
+        possible_kwargs = _DEFAULT_KWARGS
+    else:
+        possible_kwargs = {
+            "db": db,
+            "catalog": catalog,
+            "schema": schema,
+            "dialect": dialect,
+            "isolate_tables": True,  # needed for other optimizations to perform well
+            "quote_identifiers": False,
+            **kwargs,
         }
-        optimized = rule(optimized, **rule_kwargs)
 
-    return optimized
+    # Precomputed plans only account for the known kwargs, so they can't be used if the
+    # caller passes kwargs that aren't in that set
+    extra_kwargs = kwargs.keys() - _POSSIBLE_KWARGS
+
+    # Only AST inputs need a defensive copy -- parsing a string already produces a
+    # fresh tree, so copying it again would just duplicate work. Branching here is
+    # cheaper than `exp.maybe_parse`, which re-dispatches on the input type
+    if isinstance(expression, exp.Expression):
+        optimized = expression.copy()
+    else:
+        optimized = parse_one(expression, dialect=dialect)
+
+    if rules is RULES and not extra_kwargs:
+        pipeline = _PARALLEL_PIPELINE if parallel_ctes else _DEFAULT_PIPELINE
+        optimized = pipeline(optimized, possible_kwargs)
+
+        if stable_schema and not kwargs:
+            optimized.meta[OPTIMIZED] = (context, hash(optimized))
+
+        if cache_key is not None:
+            with _OPTIMIZE_CACHE_LOCK:
+                _OPTIMIZE_CACHE[cache_key] = (schema, optimized)
+                if len(_OPTIMIZE_CACHE) > _OPTIMIZE_CACHE_SIZE:
+                    _OPTIMIZE_CACHE.popitem(last=False)
+            return optimized.copy()
+
+        return optimized
+
+    chain = []
+    for rule in rules:
+        rule_plan = None if extra_kwargs else _RULE_PLANS.get(rule)
+        if rule_plan is None:
+            # Find any additional rule parameters, beyond `expression`
+            rule_params = _RULE_PARAMS.get(rule)
+            if rule_params is None:
+                rule_params = inspect.getfullargspec(rule).args
+            rule_kwargs = {
+                param: possible_kwargs[param] for param in rule_params if param in possible_kwargs
+            }
+        else:
+            rule_kwargs = {param: possible_kwargs[param] for param in rule_plan}
+
+        chain.append(functools.partial(rule, **rule_kwargs))
+
+    if parallel_ctes:
+        # The pre-pass needs qualified input, so it's spliced in right after
+        # `qualify` when the rule sequence includes it
+        position = list(rules).index(qualify) + 1 if qualify in rules else 0
+        chain.insert(position, functools.partial(_simplify_ctes_in_parallel, dialect=dialect))
+
+    return functools.reduce(lambda expression, rule: rule(expression), chain, optimized)
+
+
+def _optimize_cache_clear() -> None:
+    with _OPTIMIZE_CACHE_LOCK:
+        _OPTIMIZE_CACHE.clear()
+
+
+optimize.cache_clear = _optimize_cache_clear  # type: ignore
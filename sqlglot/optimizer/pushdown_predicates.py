@@ -1,11 +1,23 @@
+from __future__ import annotations
+
+import typing as t
+
 from sqlglot import exp
-from sqlglot.optimizer.normalize import normalized
+from sqlglot.optimizer.normalize import DEFAULT_MAX_DISTANCE, normalization_distance, normalized
 from sqlglot.optimizer.scope import build_scope, find_in_scope
-from sqlglot.optimizer.simplify import simplify
+from sqlglot.optimizer.simplify import rewrite_between, simplify
 from sqlglot import Dialect
 
+if t.TYPE_CHECKING:
+    from sqlglot.dialects.dialect import DialectType
+
 
-def pushdown_predicates(expression, dialect=None):
+def pushdown_predicates(
+    expression: exp.Expression,
+    dialect: DialectType = None,
+    conservative: bool = False,
+    max_distance: int = DEFAULT_MAX_DISTANCE,
+) -> exp.Expression:
     """
     Rewrite sqlglot AST to pushdown predicates in FROMS and JOINS
 
@@ -18,6 +30,10 @@ def pushdown_predicates(expression, dialect=None):
 
     Args:
         expression (sqlglot.Expression): expression to optimize
+        conservative (bool): whether to only move predicates that neither contain
+            subqueries nor reference columns from outside their scope
+        max_distance (int): the `max_distance` that `normalize` will run with, which
+            the conservative mode mirrors when deciding what's safe to move
     Returns:
         sqlglot.Expression: optimized expression
     """
@@ -35,6 +51,7 @@ def pushdown_predicates(expression, dialect=None):
         for scope in reversed(list(root.traverse())):
             select = scope.expression
             where = select.args.get("where")
+            scope_tables = set(scope.selected_sources) if conservative else None
             if where:
                 selected_sources = scope.selected_sources
                 join_index = {
@@ -55,7 +72,15 @@ def pushdown_predicates(expression, dialect=None):
                             break
 
                 if pushdown_allowed:
-                    pushdown(where.this, selected_sources, scope_ref_count, dialect, join_index)
+                    pushdown(
+                        where.this,
+                        selected_sources,
+                        scope_ref_count,
+                        dialect,
+                        join_index,
+                        scope_tables,
+                        max_distance,
+                    )
 
             # joins should only pushdown into itself, not to other joins
             # so we limit the selected sources to only itself
@@ -67,17 +92,89 @@ def pushdown_predicates(expression, dialect=None):
                         {name: scope.selected_sources[name]},
                         scope_ref_count,
                         dialect,
+                        scope_tables=scope_tables,
+                        max_distance=max_distance,
                     )
 
     return expression
 
 
-def pushdown(condition, sources, scope_ref_count, dialect, join_index=None):
+def early_pushdown_predicates(
+    expression: exp.Expression,
+    dialect: DialectType = None,
+    dnf: bool = False,
+    max_distance: int = DEFAULT_MAX_DISTANCE,
+) -> exp.Expression:
+    """
+    A conservative `pushdown_predicates` pass meant to run before `normalize`.
+
+    Pushing single-source predicates down before normalization shrinks the conditions
+    that the (potentially exponential) normalization step has to process. Predicates
+    that contain subqueries or that reference columns from an outer scope are left in
+    place, because `unnest_subqueries` hasn't run yet: moving them into join conditions
+    can make the join graph cyclic or hide the patterns that unnesting looks for.
+    Predicates that aren't already in conjunctive normal form also stay put, so that
+    `normalize` still sees them as part of the whole condition and its `max_distance`
+    guard against exponential expansion keeps applying; the post-normalize pass picks
+    them up instead.
+
+    This accepts the same `dnf` and `max_distance` arguments as `normalize`, so that
+    the decisions it mirrors are the ones `normalize` will actually make.
+    """
+    if dnf:
+        # The conservative pass mirrors the decisions `normalize` makes when
+        # converting to CNF; when normalizing to DNF there's nothing it can safely do
+        return expression
+
+    return pushdown_predicates(
+        expression, dialect=dialect, conservative=True, max_distance=max_distance
+    )
+
+
+def _safe_to_move(predicate: exp.Expression, scope_tables: t.Set[str], rewrite: bool) -> bool:
+    if rewrite:
+        predicate = predicate.copy().transform(rewrite_between, copy=False)
+        if not normalized(predicate):
+            return False
+
+    return not predicate.find(exp.Select) and not (exp.column_table_names(predicate) - scope_tables)
+
+
+def pushdown(
+    condition,
+    sources,
+    scope_ref_count,
+    dialect,
+    join_index=None,
+    scope_tables=None,
+    max_distance=DEFAULT_MAX_DISTANCE,
+):
     if not condition:
         return
 
-    condition = condition.replace(simplify(condition, dialect=dialect))
-    cnf_like = normalized(condition) or not normalized(condition, dnf=True)
+    if scope_tables is None:
+        condition = condition.replace(simplify(condition, dialect=dialect))
+        gauge = condition
+        will_normalize = False
+    else:
+        # The conservative pass must not change the decisions `normalize` makes later,
+        # so it mirrors them: connectors that already look normalized are skipped
+        # outright (BETWEENs unrewritten and all), everything else is BETWEEN-rewritten
+        # and then gated on the expansion-cost estimate. Conditions that aren't moved
+        # are left completely untouched -- even simplifying them in place could flip
+        # one of those decisions
+        will_normalize = not normalized(condition)
+        gauge = (
+            condition.copy().transform(rewrite_between, copy=False) if will_normalize else condition
+        )
+
+        if will_normalize and normalization_distance(gauge, max_=max_distance) > max_distance:
+            # `normalize` refuses to expand conditions that are too wide. Moving
+            # conjuncts out of one would shrink what `normalize` sees and let it
+            # expand the remainder it would otherwise have left alone
+            return
+
+    cnf_like = normalized(gauge) or not normalized(gauge, dnf=True)
 
     predicates = list(
         condition.flatten()
@@ -85,15 +182,38 @@ def pushdown(condition, sources, scope_ref_count, dialect, join_index=None):
         else [condition]
     )
 
+    if scope_tables is not None:
+        if not cnf_like:
+            # DNF pushdown copies predicates per source while leaving the original in
+            # place, which expands rather than shrinks the tree; leave these for the
+            # post-normalize pass
+            return
+        predicates = [
+            predicate
+            for predicate in predicates
+            if _safe_to_move(predicate, scope_tables, rewrite=will_normalize)
+        ]
+
     if cnf_like:
-        pushdown_cnf(predicates, sources, scope_ref_count, join_index=join_index)
+        pushdown_cnf(
+            predicates,
+            sources,
+            scope_ref_count,
+            join_index=join_index,
+            joins_only=scope_tables is not None,
+        )
     else:
         pushdown_dnf(predicates, sources, scope_ref_count)
 
 
-def pushdown_cnf(predicates, sources, scope_ref_count, join_index=None):
+def pushdown_cnf(predicates, sources, scope_ref_count, join_index=None, joins_only=False):
     """
     If the predicates are in CNF like form, we can simply replace each block in the parent.
+
+    If `joins_only` is set, predicates are only moved into join conditions within the
+    same scope, never into a source's subquery. The conservative pre-normalize pass
+    uses this because crossing a scope boundary cascades one scope further per pass,
+    relocating predicates to places a single post-normalize pass would never put them.
     """
     join_index = join_index or {}
     for predicate in predicates:
@@ -108,7 +228,7 @@ def pushdown_cnf(predicates, sources, scope_ref_count, join_index=None):
                     predicate.replace(exp.true())
                     node.on(predicate, copy=False)
                     break
-            if isinstance(node, exp.Select):
+            if isinstance(node, exp.Select) and not joins_only:
                 predicate.replace(exp.true())
                 inner_predicate = replace_aliases(node, predicate)
                 if find_in_scope(inner_predicate, exp.AggFunc):
@@ -157,7 +277,9 @@ def pushdown_dnf(predicates, sources, scope_ref_count):
             predicate = conditions[name]
 
             if isinstance(node, exp.Join):
-                node.on(predicate, copy=False)
+                # DNF predicates are left in their original form, so the pushed down
+                # predicate must be a copy to keep the tree free of shared nodes
+                node.on(predicate.copy(), copy=False)
             elif isinstance(node, exp.Select):
                 inner_predicate = replace_aliases(node, predicate)
                 if find_in_scope(inner_predicate, exp.AggFunc):
@@ -1,8 +1,17 @@
+import functools
 import unittest
 
-from sqlglot import exp, parse_one
+from sqlglot import exp, parse_one as _uncached_parse_one
 from sqlglot.diff import Insert, Move, Remove, Update, diff
 
+_cached_parse_one = functools.lru_cache(maxsize=None)(_uncached_parse_one)
+
+
+def parse_one(sql, read=None, dialect=None):
+    # The fixtures below parse the same SQL over and over; copying a cached tree is
+    # much cheaper than re-parsing it, and the copy prevents cross-test aliasing
+    return _cached_parse_one(sql, read, dialect).copy()
+
 
 def diff_delta_only(source, target, matchings=None, **kwargs):
     return diff(source, target, matchings=matchings, delta_only=True, **kwargs)
@@ -341,4 +350,23 @@ class TestDiff(unittest.TestCase):
         )
 
     def _validate_delta_only(self, actual_delta, expected_delta):
-        self.assertEqual(set(actual_delta), set(expected_delta))
+        # Sorting by a cheap deterministic key avoids hashing every tree the way a set
+        # comparison would, and failures show an ordered diff instead of a symmetric
+        # set difference. Deduplicating after the sort preserves the set semantics:
+        # the diff can legitimately emit equal edits for distinct node pairs
+        def edit_key(edit):
+            expressions = (
+                (edit.expression,)
+                if isinstance(edit, (Insert, Remove))
+                else (edit.source, edit.target)
+            )
+            return (type(edit).__name__, *(expression.sql() for expression in expressions))
+
+        def sorted_unique(delta):
+            edits = []
+            for edit in sorted(delta, key=edit_key):
+                if not edits or edit != edits[-1]:
+                    edits.append(edit)
+            return edits
+
+        self.assertEqual(sorted_unique(actual_delta), sorted_unique(expected_delta))
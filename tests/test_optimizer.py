@@ -217,6 +217,115 @@ class TestOptimizer(unittest.TestCase):
             schema=schema,
         )
 
+    def test_optimize_cache(self):
+        optimizer.optimize.cache_clear()
+
+        schema = MappingSchema({"t": {"a": "INT"}})
+        first = optimizer.optimize("SELECT a FROM t", schema=schema)
+        second = optimizer.optimize("SELECT a FROM t", schema=schema)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+        # Cached trees are copied on the way out, so mutating a result must not
+        # leak into subsequent calls
+        second.select("1 AS b", copy=False)
+        self.assertEqual(optimizer.optimize("SELECT a FROM t", schema=schema), first)
+
+        # Schema mappings are wrapped in throwaway `MappingSchema` objects whose ids
+        # can be reused for unrelated schemas, so they must bypass the cache
+        optimizer.optimize("SELECT a FROM t", schema={"t": {"a": "INT"}})
+        with self.assertRaises(OptimizeError):
+            optimizer.optimize("SELECT a FROM t", schema={"t": {"b": "INT"}})
+
+        # A fresh `Schema` instance per call must never hit another schema's entry,
+        # even when the allocator hands it a collected schema's address
+        for i in range(50):
+            fresh = MappingSchema({"t": {f"c{i}": "INT"}})
+            self.assertEqual(
+                optimizer.optimize("SELECT * FROM t", schema=fresh).sql(),
+                f'SELECT "t"."c{i}" AS "c{i}" FROM "t" AS "t"',
+            )
+
+        star_schema = MappingSchema({"t": {"a": "INT"}})
+        self.assertEqual(
+            optimizer.optimize("SELECT * FROM t", schema=star_schema).sql(),
+            'SELECT "t"."a" AS "a" FROM "t" AS "t"',
+        )
+
+        # `cache_clear` picks up out-of-band schema mutations
+        star_schema.add_table("t", {"a": "INT", "b": "INT"})
+        optimizer.optimize.cache_clear()
+        self.assertEqual(
+            optimizer.optimize("SELECT * FROM t", schema=star_schema).sql(),
+            'SELECT "t"."a" AS "a", "t"."b" AS "b" FROM "t" AS "t"',
+        )
+
+        optimizer.optimize.cache_clear()
+
+    def test_optimize_fixed_point(self):
+        optimizer.optimize.cache_clear()
+
+        schema = MappingSchema({"t": {"x": "INT"}})
+        optimized = optimizer.optimize(parse_one("SELECT x + 1 + 1 AS a FROM t"), schema=schema)
+        self.assertEqual(optimized.sql(), 'SELECT "t"."x" + 2 AS "a" FROM "t" AS "t"')
+
+        # Re-optimizing optimize's own output in the same context short-circuits
+        self.assertEqual(optimizer.optimize(optimized, schema=schema), optimized)
+
+        # Mutating a previously optimized tree invalidates its marker, so it's fully
+        # re-optimized: the new projection gets folded and qualified
+        mutated = optimized.copy()
+        mutated.select("1 + 1", copy=False)
+        self.assertEqual(
+            optimizer.optimize(mutated, schema=schema).sql(),
+            'SELECT "t"."x" + 2 AS "a", 2 AS "_col_1" FROM "t" AS "t"',
+        )
+
+        # The marker is bound to the schema it was produced with, so a different
+        # schema re-runs the pipeline, including validation
+        with self.assertRaises(OptimizeError):
+            optimizer.optimize(optimized, schema=MappingSchema({"t": {"y": "INT"}}))
+
+        # Markers identify schemas by a token that's never reused, so even after the
+        # marker's schema is collected, a fresh incompatible schema that recycles its
+        # address must still re-validate and raise
+        marked = optimizer.optimize(
+            parse_one("SELECT x FROM t"), schema=MappingSchema({"t": {"x": "INT"}})
+        )
+        for _ in range(50):
+            with self.assertRaises(OptimizeError):
+                optimizer.optimize(marked, schema=MappingSchema({"t": {"y": "INT"}}))
+
+        optimizer.optimize.cache_clear()
+
+    def test_optimize_parallel_ctes(self):
+        schema = MappingSchema({"t": {"x": "INT"}})
+        sql = """
+            WITH a AS (SELECT x + 1 + 1 AS q FROM t GROUP BY q),
+            b AS (SELECT x + 2 AS r FROM t)
+            SELECT a.q + b.r AS s FROM a CROSS JOIN b
+        """
+
+        serial = optimizer.optimize(parse_one(sql), schema=schema).sql()
+        parallel = optimizer.optimize(parse_one(sql), schema=schema, parallel_ctes=True).sql()
+
+        self.assertEqual(serial, parallel)
+
+        # The pre-pass runs on the qualified tree, so simplify's GROUP BY protection
+        # engages and the grouped-by expression isn't folded out from under its alias
+        self.assertIn('"x" + 1 + 1', parallel)
+
+        # The pre-pass is spliced in after `qualify` on the custom-rules path too
+        self.assertEqual(
+            optimizer.optimize(
+                parse_one(sql),
+                schema=schema,
+                parallel_ctes=True,
+                rules=list(optimizer.optimizer.RULES),
+            ).sql(),
+            serial,
+        )
+
     def test_isolate_table_selects(self):
         self.check_file(
             "isolate_table_selects",
@@ -620,6 +729,35 @@ SELECT :with,WITH :expressions,CTE :this,UNION :this,SELECT :expressions,1,:expr
     def test_pushdown_predicates(self):
         self.check_file("pushdown_predicates", optimizer.pushdown_predicates.pushdown_predicates)
 
+    def test_early_pushdown_predicates(self):
+        # The early pass mirrors the `max_distance`/`dnf` that `normalize` actually
+        # runs with, so adding it to the pipeline must not change the output even
+        # when those arguments are customized
+        schema = MappingSchema(
+            {
+                "t1": {"a": "INT", "b": "INT", "c": "INT", "d": "INT"},
+                "t2": {"x": "INT", "y": "INT"},
+            }
+        )
+        sql = (
+            "SELECT t1.a AS a FROM t1 CROSS JOIN t2 WHERE t2.y = 1 AND t2.x = 2 "
+            "AND (t1.a = 1 AND t1.b = 2 OR t1.c = 3 AND t1.d = 4)"
+        )
+        no_early_rules = [
+            rule
+            for rule in optimizer.optimizer.RULES
+            if rule is not optimizer.pushdown_predicates.early_pushdown_predicates
+        ]
+
+        for kwargs in ({}, {"max_distance": 3}, {"dnf": True}):
+            with self.subTest(kwargs):
+                self.assertEqual(
+                    optimizer.optimize(parse_one(sql), schema=schema, **kwargs).sql(),
+                    optimizer.optimize(
+                        parse_one(sql), schema=schema, rules=no_early_rules, **kwargs
+                    ).sql(),
+                )
+
     def test_expand_alias_refs(self):
         # check order of lateral expansion with no schema
         self.assertEqual(